@@ -10,8 +10,160 @@ Ejemplo de uso:
 
 import sys
 import os
+import re
+import mmap
+import queue
+import shutil
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
 from pypdf import PdfReader, PdfWriter
 
+# numpy es opcional: solo acelera la validación de páginas
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+# Caché en disco de rangos ya extraídos, por hash del PDF de entrada
+_CACHE_DIR = Path.home() / ".cache" / "split_pdf"
+
+# Token "número" o "número-número", con espacios opcionales, terminado
+# en coma o fin de cadena
+_RANGE_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+))?\s*(?:,|$)')
+
+# Umbral a partir del cual conviene saltarse la caché de páginas del kernel
+_DIRECT_IO_THRESHOLD = 100 << 20  # 100 MiB
+_DIRECT_IO_BUFFER = 4 << 20  # búfer alineado de 4 MiB
+
+# Por encima de esto no conviene duplicar la salida en memoria
+_ONE_SHOT_LIMIT = 1 << 30  # 1 GiB
+
+
+def _write_all(output_file, data):
+    """
+    Escribe `data` completo en un archivo abierto sin búfer.
+
+    El write de un FileIO crudo es un solo syscall y puede escribir
+    menos de lo pedido (disco lleno, cuotas, RLIMIT_FSIZE): reintentar
+    con el conteo devuelto y fallar si no avanza, en vez de dar por
+    buena una salida truncada.
+
+    Args:
+        output_file: Archivo abierto en modo binario con buffering=0
+        data (bytes o memoryview): Contenido completo a escribir
+
+    Raises:
+        OSError: Si una escritura no avanza
+    """
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            n = output_file.write(view[written:])
+            if not n:
+                raise OSError(
+                    f"Escritura corta en '{output_file.name}': "
+                    f"{written} de {len(view)} bytes"
+                )
+            written += n
+
+
+def _write_direct(output_path, data):
+    """
+    Escribe `data` en disco con O_DIRECT (solo Linux).
+
+    Evita que una salida enorme pase dos veces por memoria (búfer de
+    Python + caché de páginas del kernel). O_DIRECT exige escrituras
+    alineadas, así que se copia por bloques a un búfer mmap (alineado a
+    página) y se recorta el relleno final con ftruncate.
+
+    Args:
+        output_path (str): Ruta del archivo de salida
+        data (bytes o memoryview): Contenido completo a escribir
+
+    Raises:
+        OSError: Si el sistema de archivos no soporta O_DIRECT (EINVAL)
+    """
+    fd = os.open(
+        output_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT,
+        0o644,
+    )
+    try:
+        with mmap.mmap(-1, _DIRECT_IO_BUFFER) as buffer:
+            view = memoryview(data)
+            offset = 0
+            while offset < len(view):
+                chunk = view[offset:offset + _DIRECT_IO_BUFFER]
+                buffer.seek(0)
+                buffer.write(chunk)
+                # Rellenar el último bloque hasta un múltiplo de 4 KiB
+                aligned = (len(chunk) + 4095) & ~4095
+                if aligned > len(chunk):
+                    buffer.write(b'\x00' * (aligned - len(chunk)))
+                # os.write puede escribir menos de lo pedido (escritura
+                # corta, plausible con O_DIRECT): reintentar hasta
+                # completar el bloque alineado
+                with memoryview(buffer)[:aligned] as block:
+                    written = 0
+                    while written < aligned:
+                        n = os.write(fd, block[written:])
+                        if n == 0:
+                            raise OSError(
+                                f"Escritura corta en '{output_path}': "
+                                f"{written} de {aligned} bytes"
+                            )
+                        written += n
+                offset += len(chunk)
+        # Recortar el relleno al tamaño real
+        os.ftruncate(fd, len(view))
+    finally:
+        os.close(fd)
+
+
+def _save_output(writer, output_path, size_hint=0):
+    """
+    Guarda el contenido de un PdfWriter en un archivo.
+
+    Lo normal es serializar primero a memoria y volcar el resultado con
+    una sola escritura, en vez de dejar que las miles de escrituras
+    pequeñas de pypdf lleguen al sistema de archivos. Salidas muy
+    grandes (>1 GiB) se escriben en streaming con búfer de 1 MiB para
+    no duplicarlas en RAM, y las grandes (>100 MiB) en Linux intentan
+    E/S directa (O_DIRECT) con fallback si el sistema de archivos no la
+    soporta (p. ej. tmpfs o NFS).
+
+    Args:
+        writer (PdfWriter): Escritor con las páginas ya agregadas
+        output_path (str): Ruta del archivo de salida
+        size_hint (int): Tamaño estimado de la salida en bytes
+    """
+    # Salida gigante: streaming con búfer para no duplicar memoria
+    if size_hint > _ONE_SHOT_LIMIT:
+        with open(output_path, 'wb', buffering=1 << 20) as output_file:
+            writer.write(output_file)
+        return
+
+    # Serializar a memoria y escribir de un solo golpe
+    buffer = BytesIO()
+    writer.write(buffer)
+    data = buffer.getbuffer()
+
+    if sys.platform == 'linux' and len(data) > _DIRECT_IO_THRESHOLD:
+        try:
+            _write_direct(output_path, data)
+            return
+        except OSError:
+            logger.debug("O_DIRECT no soportado en %s", output_path)
+
+    with open(output_path, 'wb', buffering=0) as output_file:
+        _write_all(output_file, data)
+
 
 def parse_page_ranges(ranges_str):
     """
@@ -30,82 +182,124 @@ def parse_page_ranges(ranges_str):
         >>> parse_page_ranges("10")
         [9]
     """
-    pages = set()  # Usamos set para evitar duplicados
-    
-    # Separar por comas para obtener cada rango o página individual
-    ranges = ranges_str.split(',')
-    
-    for range_part in ranges:
-        range_part = range_part.strip()  # Eliminar espacios en blanco
-        
-        if '-' in range_part:
-            # Es un rango: "1-10"
-            start, end = range_part.split('-')
-            start = int(start.strip())
-            end = int(end.strip())
-            
-            # Agregar todas las páginas del rango
-            # Restamos 1 porque los índices en pypdf empiezan en 0
-            for page_num in range(start, end + 1):
-                pages.add(page_num - 1)
-        else:
-            # Es una página individual: "5"
-            page_num = int(range_part)
-            pages.add(page_num - 1)
-    
-    # Convertir a lista ordenada
-    return sorted(list(pages))
+    # Una sola pasada del regex precompilado en vez de split/strip/int
+    # por cada parte; de paso tolera espacios alrededor de los números
+    segments = []
+    last_index = -1
+    monotonic = True
 
+    for match in _RANGE_RE.finditer(ranges_str):
+        # Restamos 1 porque los índices en pypdf empiezan en 0
+        start = int(match.group(1)) - 1
+        end = int(match.group(2)) if match.group(2) else start + 1
+        if start <= last_index:
+            monotonic = False
+        last_index = end - 1
+        segments.append(range(start, end))
 
-def split_pdf(input_path, pages, output_path):
+    # Rechazar entradas vacías o con partes que el regex no reconoció
+    if not segments or _RANGE_RE.sub('', ranges_str).strip():
+        raise ValueError(f"Rango de páginas inválido: '{ranges_str}'")
+
+    # Caso típico ("1-10,15,20-25"): los rangos ya vienen ordenados y
+    # sin solaparse, así que se emiten directo sin set ni sort
+    if monotonic:
+        pages = []
+        for segment in segments:
+            pages.extend(segment)
+        return pages
+
+    # set().union itera los rangos en C: mucho más rápido que agregar
+    # página por página, y de paso elimina duplicados
+    return sorted(set().union(*segments))
+
+
+def _load_reader(input_path):
     """
-    Extrae páginas específicas de un PDF y las guarda en un nuevo archivo.
-    
+    Lee un PDF completo a memoria y construye su PdfReader.
+
     Args:
         input_path (str): Ruta del archivo PDF de origen
+
+    Returns:
+        tuple: (contenido en bytes, PdfReader ya construido)
+
+    Raises:
+        FileNotFoundError: Si el archivo de entrada no existe
+    """
+    # Abrir directamente en vez de verificar con os.path.exists antes:
+    # ahorra un stat (que en un sistema de archivos de red es un viaje
+    # completo) y evita la carrera entre verificar y abrir
+    try:
+        fh = open(input_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"El archivo '{input_path}' no existe.")
+
+    # Leer el PDF de origen una sola vez a memoria: parsear desde un
+    # BytesIO evita miles de lecturas pequeñas sobre el archivo
+    with fh:
+        # Avisar al kernel que viene una lectura secuencial completa,
+        # para que el readahead prefetchee mientras parseamos
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass  # hay sistemas de archivos que no lo aceptan
+        pdf_data = fh.read()
+    return pdf_data, PdfReader(BytesIO(pdf_data))
+
+
+def split_pdf_with_reader(reader, pages, output_path, size_hint=0):
+    """
+    Extrae páginas usando un PdfReader ya construido.
+
+    Permite reutilizar un reader parseado de antemano (por ejemplo, en
+    segundo plano mientras el usuario escribe) sin volver a abrir ni
+    parsear el archivo.
+
+    Args:
+        reader (PdfReader): Lector del PDF de origen
         pages (list): Lista de números de página a extraer (índices base 0)
         output_path (str): Ruta donde se guardará el PDF resultante
-    
+        size_hint (int): Tamaño estimado de la salida en bytes
+
     Raises:
-        FileNotFoundError: Si el archivo de entrada no existe
         ValueError: Si alguna página está fuera de rango
     """
-    # Verificar que el archivo de entrada existe
-    if not os.path.exists(input_path):
-        raise FileNotFoundError(f"El archivo '{input_path}' no existe.")
-    
-    # Leer el PDF de origen
-    print(f"Leyendo archivo: {input_path}")
-    reader = PdfReader(input_path)
     total_pages = len(reader.pages)
-    
+
     print(f"Total de páginas en el PDF: {total_pages}")
-    
-    # Validar que todas las páginas solicitadas existen
-    for page_num in pages:
-        if page_num < 0 or page_num >= total_pages:
-            raise ValueError(
-                f"Página {page_num + 1} fuera de rango. "
-                f"El PDF tiene {total_pages} páginas."
-            )
-    
-    # Crear el escritor de PDF
-    writer = PdfWriter()
-    
-    # Agregar las páginas seleccionadas
+
+    # Extraer y guardar con la primitiva común (valida, selecciona por
+    # tramos contiguos y escribe)
     print(f"Extrayendo {len(pages)} página(s)...")
-    for page_num in pages:
-        writer.add_page(reader.pages[page_num])
-        print(f"  - Página {page_num + 1} agregada")
-    
-    # Guardar el nuevo PDF
-    print(f"Guardando archivo: {output_path}")
-    with open(output_path, 'wb') as output_file:
-        writer.write(output_file)
-    
+    _split_ranges(reader, [(None, pages)], lambda _: output_path,
+                  size_hint=size_hint)
+    print(f"Guardado archivo: {output_path}")
+
     print(f"¡Listo! PDF creado exitosamente.")
 
 
+def split_pdf(input_path, pages, output_path):
+    """
+    Extrae páginas específicas de un PDF y las guarda en un nuevo archivo.
+
+    Args:
+        input_path (str): Ruta del archivo PDF de origen
+        pages (list): Lista de números de página a extraer (índices base 0)
+        output_path (str): Ruta donde se guardará el PDF resultante
+
+    Raises:
+        FileNotFoundError: Si el archivo de entrada no existe
+        ValueError: Si alguna página está fuera de rango
+    """
+    print(f"Leyendo archivo: {input_path}")
+    pdf_data, reader = _load_reader(input_path)
+    split_pdf_with_reader(reader, pages, output_path,
+                          size_hint=len(pdf_data))
+
+
 def parse_multiple_ranges(ranges_str):
     """
     Convierte una cadena de rangos en una lista de rangos individuales.
@@ -149,68 +343,334 @@ def parse_multiple_ranges(ranges_str):
     return ranges_list
 
 
-def split_pdf_multiple(input_path, ranges_str, output_prefix="documento"):
+def _split_ranges(reader, named_ranges, out_path_fn, size_hint=0):
+    """
+    Primitiva común de extracción: un archivo de salida por rango.
+
+    Concentra la validación, la selección de páginas por tramos y la
+    escritura que antes estaban duplicadas entre split_pdf y
+    split_pdf_multiple. Con varias salidas, un hilo consumidor escribe
+    el rango N a disco mientras este hilo construye el rango N+1.
+
+    Cada rango usa un PdfWriter nuevo: el mapa interno de traducción de
+    ids de pypdf (_id_translated) apunta a posiciones dentro de
+    _objects del escritor que lo creó, así que compartirlo entre
+    escritores produce referencias colgantes. Los recursos compartidos
+    del origen (fuentes, imágenes) no se reparsean igualmente, porque
+    el reader es único.
+
+    Args:
+        reader (PdfReader): Lector del PDF de origen
+        named_ranges (list): Lista de tuplas (nombre, lista_paginas)
+        out_path_fn: Función que convierte un nombre en ruta de salida
+        size_hint (int): Tamaño estimado de cada salida en bytes
+
+    Returns:
+        list: Lista de tuplas (ruta_creada, cantidad_de_paginas)
+
+    Raises:
+        ValueError: Si alguna página está fuera de rango
+    """
+    total_pages = len(reader.pages)
+    _validate_pages(
+        [page_num for _, pages in named_ranges for page_num in pages],
+        total_pages,
+    )
+
+    if len(named_ranges) == 1:
+        # Una sola salida: escribir directo con _save_output, que ya
+        # decide entre write único, O_DIRECT o streaming
+        nombre, pages = named_ranges[0]
+        writer = PdfWriter()
+        for start, stop in _runs(pages):
+            writer.append(reader, pages=(start, stop))
+        output_path = out_path_fn(nombre)
+        _save_output(writer, output_path, size_hint=size_hint)
+        return [(output_path, len(pages))]
+
+    # Varias salidas: pipeline productor/consumidor con a lo sumo un
+    # rango serializado en vuelo
+    write_queue = queue.Queue(maxsize=1)
+    write_errors = []  # excepción del hilo consumidor, si falló
+
+    def _disk_writer():
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+            if write_errors:
+                # Tras un fallo, seguir drenando la cola sin escribir
+                # para que el productor nunca se quede bloqueado en put
+                continue
+            path, data = item
+            try:
+                with open(path, 'wb', buffering=0) as output_file:
+                    _write_all(output_file, data)
+            except Exception as exc:
+                write_errors.append(exc)
+
+    disk_thread = threading.Thread(target=_disk_writer)
+    disk_thread.start()
+    results = []
+    try:
+        for nombre, pages in named_ranges:
+            if write_errors:
+                break
+            writer = PdfWriter()
+            for start, stop in _runs(pages):
+                writer.append(reader, pages=(start, stop))
+            output_path = out_path_fn(nombre)
+            if size_hint > _ONE_SHOT_LIMIT:
+                # Salida potencialmente gigante: escribirla síncrona en
+                # streaming vía _save_output en vez de duplicarla en
+                # memoria dentro de la cola
+                _save_output(writer, output_path, size_hint=size_hint)
+            else:
+                buffer = BytesIO()
+                writer.write(buffer)
+                write_queue.put((output_path, buffer.getvalue()))
+            results.append((output_path, len(pages)))
+    finally:
+        write_queue.put(None)
+        disk_thread.join()
+
+    # No reportar éxito si alguna escritura falló: propagar el error
+    # del hilo consumidor como si hubiera ocurrido aquí
+    if write_errors:
+        raise write_errors[0]
+    return results
+
+
+def _validate_pages(pages, total_pages):
+    """
+    Verifica que todas las páginas solicitadas existan en el PDF.
+
+    Con numpy instalado, el chequeo de límites corre vectorizado en C;
+    si no, se recorre la lista en Python con membresía en set.
+
+    Args:
+        pages (list): Lista de números de página a validar (índices base 0)
+        total_pages (int): Cantidad de páginas del PDF
+
+    Raises:
+        ValueError: Si alguna página está fuera de rango
+    """
+    if numpy is not None:
+        arr = numpy.asarray(pages, dtype=numpy.int64)
+        if arr.size and (arr.min() < 0 or arr.max() >= total_pages):
+            bad = int(arr[(arr < 0) | (arr >= total_pages)][0])
+            raise ValueError(
+                f"Página {bad + 1} fuera de rango. "
+                f"El PDF tiene {total_pages} páginas."
+            )
+        return
+
+    valid_pages = set(range(total_pages))
+    for page_num in pages:
+        if page_num not in valid_pages:
+            raise ValueError(
+                f"Página {page_num + 1} fuera de rango. "
+                f"El PDF tiene {total_pages} páginas."
+            )
+
+
+def _runs(sorted_pages):
+    """
+    Genera los tramos contiguos de una lista ordenada de páginas.
+
+    Args:
+        sorted_pages (list): Números de página en orden ascendente
+
+    Yields:
+        tuple: Tramos semiabiertos (inicio, fin)
+
+    Ejemplos:
+        >>> list(_runs([0, 1, 2, 5]))
+        [(0, 3), (5, 6)]
+    """
+    i = 0
+    n = len(sorted_pages)
+    while i < n:
+        j = i
+        while j + 1 < n and sorted_pages[j + 1] == sorted_pages[j] + 1:
+            j += 1
+        yield sorted_pages[i], sorted_pages[j] + 1
+        i = j + 1
+
+
+def _canonical_range_name(pages):
+    """
+    Convierte una lista de páginas en un nombre de rango canónico.
+
+    Dos rangos que cubren las mismas páginas producen el mismo nombre
+    aunque se hayan escrito distinto ("3-5" y " 3 - 5 " dan "3-5"),
+    así comparten la misma entrada de caché.
+
+    Args:
+        pages (list): Lista de números de página (índices base 0)
+
+    Returns:
+        str: Rangos compactados en notación 1-based, ej. "1-5,8"
+    """
+    parts = []
+    for start, stop in _runs(sorted(set(pages))):
+        if stop - start == 1:
+            parts.append(str(start + 1))
+        else:
+            parts.append(f"{start + 1}-{stop}")
+    return ",".join(parts)
+
+
+# Reader compartido por cada proceso trabajador (lo crea _init_worker)
+_worker_reader = None
+_worker_size_hint = 0
+
+
+def _init_worker(pdf_data):
+    """
+    Inicializa un proceso trabajador creando su propio PdfReader.
+
+    Cada proceso parsea el PDF una sola vez a partir de los bytes
+    recibidos, y lo reutiliza para todos los rangos que le toquen.
+
+    Args:
+        pdf_data (bytes): Contenido completo del PDF de origen
+    """
+    global _worker_reader, _worker_size_hint
+    _worker_reader = PdfReader(BytesIO(pdf_data))
+    _worker_size_hint = len(pdf_data)
+
+
+def _write_range(job):
+    """
+    Escribe el archivo PDF de un solo rango (cuerpo del bucle paralelo).
+
+    Args:
+        job (tuple): Tupla (nombre_rango, lista_paginas, prefijo_salida)
+
+    Returns:
+        tuple: (nombre_archivo_creado, cantidad_de_paginas)
+    """
+    rango_nombre, pages, output_prefix = job
+
+    results = _split_ranges(
+        _worker_reader,
+        [(rango_nombre, pages)],
+        lambda nombre: f"{output_prefix}_paginas_{nombre}.pdf",
+        size_hint=_worker_size_hint,
+    )
+    return results[0]
+
+
+def split_pdf_multiple(input_path, ranges_str, output_prefix="documento",
+                       force_refresh=False):
     """
     Separa un PDF en múltiples archivos, uno por cada rango.
-    
+
+    Cada archivo de salida es independiente, así que cuando hay varios
+    rangos se reparten entre procesos para usar todos los núcleos.
+    Los rangos ya extraídos de este mismo PDF en ejecuciones anteriores
+    se copian desde la caché en ~/.cache/split_pdf/ sin reprocesar.
+
     Args:
         input_path (str): Ruta del archivo PDF de origen
         ranges_str (str): Cadena con rangos separados por comas
         output_prefix (str): Prefijo para los nombres de archivos de salida
-    
+        force_refresh (bool): Si es True, ignora la caché y regenera todo
+
     Returns:
         list: Lista de nombres de archivos creados
     """
-    # Verificar que el archivo de entrada existe
-    if not os.path.exists(input_path):
-        raise FileNotFoundError(f"El archivo '{input_path}' no existe.")
-    
-    # Leer el PDF de origen
+    # Leer el PDF de origen una sola vez a memoria (una sola apertura,
+    # sin stat previo)
     print(f"Leyendo archivo: {input_path}")
-    reader = PdfReader(input_path)
+    pdf_data, reader = _load_reader(input_path)
     total_pages = len(reader.pages)
-    
+
     print(f"Total de páginas en el PDF: {total_pages}")
     print()
-    
+
     # Parsear los rangos
     ranges_list = parse_multiple_ranges(ranges_str)
-    
+
     print(f"Se crearán {len(ranges_list)} archivo(s) PDF:")
     print()
-    
+
+    # Validar todas las páginas antes de despachar trabajo
+    _validate_pages(
+        [page_num for _, pages in ranges_list for page_num in pages],
+        total_pages,
+    )
+
     created_files = []
-    
-    # Crear un PDF por cada rango
+
+    # Revisar la caché: los rangos ya extraídos de este mismo PDF se
+    # copian directo, y solo los que faltan pasan al escritor
+    cache_dir = _CACHE_DIR / hashlib.sha1(pdf_data).hexdigest()
+    pending = []  # (rango_nombre, pages, ruta_en_cache)
     for rango_nombre, pages in ranges_list:
-        # Validar páginas
-        for page_num in pages:
-            if page_num < 0 or page_num >= total_pages:
-                raise ValueError(
-                    f"Página {page_num + 1} fuera de rango. "
-                    f"El PDF tiene {total_pages} páginas."
-                )
-        
-        # Crear nombre de archivo
-        output_filename = f"{output_prefix}_paginas_{rango_nombre}.pdf"
-        
-        # Crear escritor de PDF
-        writer = PdfWriter()
-        
-        # Agregar páginas
-        for page_num in pages:
-            writer.add_page(reader.pages[page_num])
-        
-        # Guardar archivo
-        with open(output_filename, 'wb') as output_file:
-            writer.write(output_file)
-        
-        created_files.append(output_filename)
-        print(f"✓ Creado: {output_filename} ({len(pages)} página(s))")
-    
+        cache_path = cache_dir / f"{_canonical_range_name(pages)}.pdf"
+        if not force_refresh and cache_path.exists():
+            output_filename = f"{output_prefix}_paginas_{rango_nombre}.pdf"
+            shutil.copyfile(cache_path, output_filename)
+            created_files.append(output_filename)
+            print(f"✓ Creado: {output_filename} "
+                  f"({len(pages)} página(s), desde caché)")
+        else:
+            pending.append((rango_nombre, pages, cache_path))
+
+    def _store_in_cache(output_filename, cache_path):
+        # Guardar copia en caché para futuras ejecuciones. Se copia a
+        # un nombre temporal y se renombra con os.replace (atómico):
+        # una interrupción a media copia deja a lo sumo un .tmp suelto,
+        # nunca un PDF truncado que las próximas ejecuciones servirían
+        # como acierto de caché
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_filename, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logger.debug("No se pudo guardar en caché: %s", cache_path)
+
+    if pending and (len(pending) == 1 or (os.cpu_count() or 1) == 1):
+        # Camino serial (un solo rango, o una sola CPU donde levantar
+        # procesos no ayuda): la primitiva común ya solapa la
+        # construcción del rango N+1 con la escritura del rango N
+        results = _split_ranges(
+            reader,
+            [(rango_nombre, pages) for rango_nombre, pages, _ in pending],
+            lambda nombre: f"{output_prefix}_paginas_{nombre}.pdf",
+            size_hint=len(pdf_data),
+        )
+        for (output_filename, num_pages), (_, _, cache_path) in zip(
+            results, pending
+        ):
+            _store_in_cache(output_filename, cache_path)
+            created_files.append(output_filename)
+            print(f"✓ Creado: {output_filename} ({num_pages} página(s))")
+    elif pending:
+        # Crear un PDF por cada rango, en paralelo
+        jobs = [
+            (rango_nombre, pages, output_prefix)
+            for rango_nombre, pages, _ in pending
+        ]
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(pdf_data,),
+        ) as executor:
+            # chunksize agrupa trabajos por lotes para acotar la memoria
+            for (_, _, cache_path), (output_filename, num_pages) in zip(
+                pending, executor.map(_write_range, jobs, chunksize=10)
+            ):
+                _store_in_cache(output_filename, cache_path)
+                created_files.append(output_filename)
+                print(f"✓ Creado: {output_filename} ({num_pages} página(s))")
+
     print()
     print(f"¡Listo! Se crearon {len(created_files)} archivo(s) PDF.")
-    
+
     return created_files
 
 
@@ -225,15 +685,23 @@ def main():
     print("=" * 60)
     print()
     
+    # Separar la bandera --force-refresh de los argumentos posicionales
+    args = [arg for arg in sys.argv[1:] if arg != '--force-refresh']
+    force_refresh = len(args) != len(sys.argv) - 1
+
+    # Future con el (pdf_data, reader) parseado en segundo plano
+    # (solo en modo interactivo)
+    reader_future = None
+
     # Verificar argumentos de línea de comandos
-    if len(sys.argv) == 4:
+    if len(args) == 3:
         # Modo: python split_pdf.py input.pdf "1-10,15" output.pdf
-        input_path = sys.argv[1]
-        ranges_str = sys.argv[2]
-        output_path = sys.argv[3]
+        input_path = args[0]
+        ranges_str = args[1]
+        output_path = args[2]
     else:
         # Modo interactivo
-        print("Uso: python split_pdf.py <archivo_entrada.pdf> <rangos> <archivo_salida.pdf>")
+        print("Uso: python split_pdf.py <archivo_entrada.pdf> <rangos> <archivo_salida.pdf> [--force-refresh]")
         print()
         print("Ejemplos de rangos:")
         print("  - Páginas individuales: 1,5,10")
@@ -243,6 +711,12 @@ def main():
         
         # Solicitar información al usuario
         input_path = input("Archivo PDF de entrada: ").strip()
+
+        # Empezar a parsear el PDF en segundo plano: cuando el usuario
+        # termine de escribir los rangos, el parseo ya estará listo
+        prompt_pool = ThreadPoolExecutor(max_workers=1)
+        reader_future = prompt_pool.submit(_load_reader, input_path)
+
         ranges_str = input("Páginas a extraer (ej: 1-34,56-58,60-90): ").strip()
         output_path = input("Nombre del archivo de salida: ").strip()
     
@@ -250,7 +724,7 @@ def main():
     
     try:
         # Preguntar modo de separación (solo en modo interactivo)
-        if len(sys.argv) != 4:
+        if len(args) != 3:
             print("¿Deseas generar archivos separados por rango?")
             print("  (s) = Sí, crear múltiples archivos (uno por cada rango)")
             print("  (n) = No, crear un solo archivo con todos los rangos")
@@ -271,7 +745,8 @@ def main():
             print()
             
             # Separar en múltiples archivos
-            split_pdf_multiple(input_path, ranges_str, prefijo)
+            split_pdf_multiple(input_path, ranges_str, prefijo,
+                               force_refresh=force_refresh)
             
         else:
             # MODO SIMPLE: Crear un solo archivo (comportamiento original)
@@ -285,11 +760,38 @@ def main():
             pages = parse_page_ranges(ranges_str)
             print(f"Páginas a extraer: {len(pages)} página(s)")
             print()
-            
-            # Realizar la separación
-            split_pdf(input_path, pages, output_path)
 
-        
+            # Realizar la separación (reutilizando el reader parseado
+            # en segundo plano si estamos en modo interactivo)
+            if reader_future is not None:
+                pdf_data, reader = reader_future.result()
+                split_pdf_with_reader(reader, pages, output_path,
+                                      size_hint=len(pdf_data))
+            else:
+                split_pdf(input_path, pages, output_path)
+
+        # Modo interactivo: ofrecer más extracciones del mismo PDF
+        # reutilizando el reader ya parseado, sin volver a abrirlo
+        if reader_future is not None:
+            pdf_data, reader = reader_future.result()
+            while True:
+                print()
+                otra = input("¿Otra extracción del mismo PDF? (s/n): ").strip().lower()
+                if otra != 's':
+                    break
+                ranges_str = input("Páginas a extraer: ").strip()
+                output_path = input("Nombre del archivo de salida: ").strip()
+                if not output_path.lower().endswith('.pdf'):
+                    output_path = output_path + '.pdf'
+                print()
+                try:
+                    pages = parse_page_ranges(ranges_str)
+                    split_pdf_with_reader(reader, pages, output_path,
+                                          size_hint=len(pdf_data))
+                except ValueError as e:
+                    # No salir del bucle por un rango mal escrito
+                    print(f"Error: {e}")
+
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)